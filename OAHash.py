@@ -1,4 +1,6 @@
 #!/bin/python3
+import time
+import timeit
 import unittest
 from collections import namedtuple
 
@@ -45,12 +47,13 @@ class HashTable(object):
 				tokens.append("{0} : {1}".format(element.key, element.value))
 		return "{" + "\n".join(tokens) + "}"
 	
-	def _get_entry(self, key):
+	def _get_entry(self, key, key_hash=None):
 		""" Return (E0,E1) where E0 is the value or EMPTY_VALUE
 		E1 is the index where it was found or if E0 is
 		EMPTY_VALUE then the next insert index for the given key
 		"""
-		key_hash = hash(key)
+		if key_hash is None:
+			key_hash = hash(key)
 		root_index = key_hash
 		for offset in range(self.containerSize):
 			index = (root_index + offset) % self.containerSize
@@ -60,15 +63,22 @@ class HashTable(object):
 				return element, index
 		raise KeyError
 	
+	def _store(self, entry, index, key_hash, key, value):
+		"""Write a value in the slot found by _get_entry, growing the
+		table if a new key pushes it past the load factor
+		"""
+		self.container[index] = TableEntry(key_hash, key, value)
+		if entry is self.NoValue:
+			self.size += 1
+			if (self.deletedSize + self.size) / self.containerSize > self.LoadFactor:
+				self._resize()
+
 	def set(self, key, value):
 
 		""""""
-		entry, index = self._get_entry(key)
-		self.container[index] = TableEntry(hash(key), key, value)
-		if entry is self.NoValue:
-			self.size += 1
-		if (self.deletedSize + self.size) / self.containerSize > self.LoadFactor:
-			self._resize()
+		key_hash = hash(key)
+		entry, index = self._get_entry(key, key_hash)
+		self._store(entry, index, key_hash, key, value)
 	
 	def __setitem__(self, key, value):
 		self.set(key, value)
@@ -96,13 +106,429 @@ class HashTable(object):
 			return None
 
 		else:
-			self.container[index] = self.NoValue
-			self.size -= 1
-			self.deletedSize += 1
+			self._remove(index)
 	
 	def __delitem__(self, key):
 		self.delete(key)
 
+	def _remove(self, index):
+		"""Empty a slot with backward-shift deletion: later entries of the
+		probe run move back into the hole when their home slot allows it,
+		so no key becomes unreachable and no tombstone is needed
+		"""
+		container = self.container
+		containerSize = self.containerSize
+		hole = index
+		while True:
+			index = (index + 1) % containerSize
+			element = container[index]
+			if element is self.NoValue:
+				break
+			home = element.hash % containerSize
+			# the entry stays if its home lies cyclically in (hole, index]
+			if (hole < index and hole < home <= index) or (hole > index and (home > hole or home <= index)):
+				continue
+			container[hole] = element
+			hole = index
+		container[hole] = self.NoValue
+		self.size -= 1
+
+	def add(self, key, delta=1):
+		"""Add delta to the value of a key, starting from 0 if absent
+		key: the key to be updated
+		delta: the amount to add
+		Returns the new value
+		"""
+		key_hash = hash(key)
+		entry, index = self._get_entry(key, key_hash)
+		value = delta if entry is self.NoValue else entry.value + delta
+		self._store(entry, index, key_hash, key, value)
+		return value
+
+	def setdefault(self, key, default=None):
+		"""Return the value of a key, inserting default first if absent
+		key: the key to be searched
+		default: the value stored for a missing key
+		"""
+		key_hash = hash(key)
+		entry, index = self._get_entry(key, key_hash)
+		if entry is not self.NoValue:
+			return entry.value
+		self._store(entry, index, key_hash, key, default)
+		return default
+
+	def get_or_compute(self, key, factory):
+		"""Return the value of a key, storing factory(key) first if absent
+		key: the key to be searched
+		factory: called with the key only when it is missing
+		"""
+		key_hash = hash(key)
+		entry, index = self._get_entry(key, key_hash)
+		if entry is not self.NoValue:
+			return entry.value
+		value = factory(key)
+		# the factory may have modified the table, so look the slot up again
+		entry, index = self._get_entry(key, key_hash)
+		self._store(entry, index, key_hash, key, value)
+		return value
+
+	def pop(self, key, default=None):
+		"""Delete a key and return its value, or default if absent
+		key: the key to be deleted
+		"""
+		entry, index = self._get_entry(key)
+		if entry is self.NoValue:
+			return default
+		self._remove(index)
+		return entry.value
+
+	def count_many(self, iterable):
+		"""Add 1 to the count of every key in iterable, e.g. a token stream.
+		The probe loop is inlined so each token costs one hash and one probe
+		sequence without method calls
+		"""
+		noValue = self.NoValue
+		for key in iterable:
+			key_hash = hash(key)
+			container = self.container
+			containerSize = self.containerSize
+			index = key_hash % containerSize
+			element = container[index]
+			while element is not noValue \
+					and not (element.hash == key_hash and element.key == key):
+				index = (index + 1) % containerSize
+				element = container[index]
+			if element is noValue:
+				self._store(element, index, key_hash, key, 1)
+			else:
+				container[index] = TableEntry(key_hash, key, element.value + 1)
+
+	@classmethod
+	def _presized(cls, count):
+		"""Return an empty table large enough to take count keys without resizing"""
+		table = cls()
+		table.containerSize = max(cls.DefaultSize, int(count // cls.MinFactor))
+		table.container = [cls.NoValue] * table.containerSize
+		return table
+
+	def _entries(self):
+		"""Yield every stored TableEntry"""
+		noValue = self.NoValue
+		for element in self.container:
+			if element is not noValue:
+				yield element
+
+	def _insert_entry(self, entry):
+		"""Store an existing TableEntry, reusing its cached hash"""
+		found, index = self._get_entry(entry.key, entry.hash)
+		self._store(found, index, entry.hash, entry.key, entry.value)
+
+	def _probe(self, other, missing=False):
+		"""Look up every entry stored in other, reusing its cached hash, and
+		yield (entry, found) for each one whose key is in self, found being
+		the entry of self, or with missing=True each entry whose key is not.
+		The probe loop is inlined so that a single generator sits between
+		the two containers
+		"""
+		noValue = self.NoValue
+		container = self.container
+		containerSize = self.containerSize
+		for entry in other.container:
+			if entry is noValue:
+				continue
+			key_hash, key, _ = entry
+			index = key_hash % containerSize
+			element = container[index]
+			while element is not noValue and not (element[0] == key_hash and element[1] == key):
+				index = (index + 1) % containerSize
+				element = container[index]
+			if element is noValue:
+				if missing:
+					yield entry
+			elif not missing:
+				yield entry, element
+
+	def _fill(self, entries):
+		"""Write entries whose keys are distinct and not yet in self, without
+		resizing: the table must be pre-sized. Only an empty slot is probed
+		for, and size is updated once at the end
+		"""
+		noValue = self.NoValue
+		container = self.container
+		containerSize = self.containerSize
+		count = 0
+		for entry in entries:
+			index = entry[0] % containerSize
+			while container[index] is not noValue:
+				index = (index + 1) % containerSize
+			container[index] = entry
+			count += 1
+		self.size += count
+
+	def union(self, other):
+		"""Return a new table with the keys of both tables; the values
+		of self win for keys present in both
+		"""
+		result = self._presized(len(self) + len(other))
+		result._fill(self._entries())
+		result._fill(self._probe(other, missing=True))
+		return result
+
+	def intersection(self, other):
+		"""Return a new table with the keys present in both tables and the
+		values of self. The smaller table is scanned and the larger probed
+		"""
+		result = self._presized(min(len(self), len(other)))
+		if len(self) <= len(other):
+			result._fill([entry for entry, _ in other._probe(self)])
+		else:
+			result._fill([found for _, found in self._probe(other)])
+		return result
+
+	def difference(self, other):
+		"""Return a new table with the keys of self that are not in other"""
+		result = self._presized(len(self))
+		result._fill(other._probe(self, missing=True))
+		return result
+
+	def join(self, other, on=None):
+		"""Hash join with another table, as a generator of
+		(key, value, other_value) tuples
+		on: if None, join on equal keys, scanning the smaller table and
+		probing the larger; otherwise a function of (key, value) giving
+		the key to look up in other for each entry of self
+		"""
+		if on is not None:
+			noValue = self.NoValue
+			for entry in self._entries():
+				found, _ = other._get_entry(on(entry.key, entry.value))
+				if found is not noValue:
+					yield entry.key, entry.value, found.value
+		elif len(self) <= len(other):
+			for entry, found in other._probe(self):
+				yield entry[1], entry[2], found[2]
+		else:
+			for entry, found in self._probe(other):
+				yield entry[1], found[2], entry[2]
+
+	def freeze(self, verify=True):
+		"""Return an immutable FrozenHashTable holding the current entries
+		verify: if False, lookups skip the key comparison and a key that
+		is not in the table maps to an arbitrary value
+		"""
+		entries = [element for element in self.container if element is not self.NoValue]
+		return FrozenHashTable(entries, verify)
+
+
+def _mix(key_hash):
+	"""Scramble a key hash: CPython's tuple hash runs two multiply-rotate
+	rounds over it in C, so hashes that differ only in their high bits
+	(floats, multiples of 2^32) still land in unrelated buckets and slots.
+	The result x gives f1 = x, f2 = x >> 40 and the bucket (x >> 20) % B;
+	no 64-bit masks are needed, as Python's % is never negative
+	"""
+	return hash((key_hash, key_hash))
+
+
+class FrozenHashTable(object):
+	""" Read-only table backed by a minimal perfect hash (CHD: compress,
+	hash and displace). Each key hash is mixed into (f1, f2) and one of
+	B = n / BucketSize buckets. Each bucket gets a
+	displacement (d0, d1) such that (f1 + d0 * f2 + d1) % n sends its keys
+	to free slots; single-key buckets, placed last, take any free slot
+	through d1. A lookup is one bucket read and one slot read, with no
+	probe loop.
+
+	Keys that no displacement can separate (same f1 and f2 modulo n, e.g.
+	-1 and -2 which share hash() -2) go to a small overflow HashTable,
+	checked when the slot holds another key.
+	"""
+	BucketSize = 2
+	MaxDisplacement = 1 << 16
+
+	def __init__(self, entries, verify=True):
+		self.size = len(entries)
+		self.verify = verify
+		self.overflow = HashTable()
+		self.bucketCount = max(1, -(-self.size // self.BucketSize))
+		self.displacements = [(0, 0)] * self.bucketCount
+		self.container = [HashTable.NoValue] * self.size
+		buckets = [[] for _ in range(self.bucketCount)]
+		for entry in entries:
+			x = _mix(entry.hash)
+			buckets[(x >> 20) % self.bucketCount].append((entry, x, x >> 40))
+		buckets = [self._separate(bucket) for bucket in buckets if bucket]
+		buckets.sort(key=len, reverse=True)
+		singles = []
+		for bucket in buckets:
+			if len(bucket) > 1:
+				self._place(bucket)
+			else:
+				singles.append(bucket[0])
+		# listed only now: every multi-key bucket has taken its slots
+		freeSlots = [i for i, element in enumerate(self.container) if element is HashTable.NoValue]
+		for entry, f1, _ in singles:
+			index = freeSlots.pop()
+			self.displacements[(f1 >> 20) % self.bucketCount] = (0, (index - f1) % self.size)
+			self.container[index] = entry
+
+	def _separate(self, bucket):
+		"""Move to the overflow table every key whose (f1, f2) modulo n
+		equals that of an earlier key of the bucket: every displacement
+		sends both to the same slot. Return the keys left in the bucket
+		"""
+		kept = []
+		seen = set()
+		for item in bucket:
+			entry, f1, f2 = item
+			signature = (f1 % self.size, f2 % self.size)
+			if signature in seen:
+				self.overflow.set(entry.key, entry.value)
+			else:
+				seen.add(signature)
+				kept.append(item)
+		return kept
+
+	def _place(self, bucket):
+		"""Find the first displacement that puts every entry of the bucket
+		in a distinct free slot, then store the entries. A bucket that no
+		displacement within MaxDisplacement fits goes to the overflow table
+		"""
+		n = self.size
+		for displacement in range(min(self.MaxDisplacement, n * n)):
+			d1, d0 = divmod(displacement, n)
+			indexes = [(f1 + d0 * f2 + d1) % n for _, f1, f2 in bucket]
+			if len(set(indexes)) == len(indexes) \
+					and all(self.container[i] is HashTable.NoValue for i in indexes):
+				break
+		else:
+			for entry, _, _ in bucket:
+				self.overflow.set(entry.key, entry.value)
+			return
+		self.displacements[(bucket[0][1] >> 20) % self.bucketCount] = (d0, d1)
+		for (entry, _, _), index in zip(bucket, indexes):
+			self.container[index] = entry
+
+	def __len__(self):
+		return self.size
+
+	def _get_entry(self, key):
+		""" Return the entry stored for the key, or NoValue """
+		size = self.size
+		if not size:
+			return HashTable.NoValue
+		key_hash = hash(key)
+		# _mix inlined: this is the hot path
+		x = hash((key_hash, key_hash))
+		d0, d1 = self.displacements[(x >> 20) % self.bucketCount]
+		element = self.container[(x + d0 * (x >> 40) + d1) % size]
+		if element.hash == key_hash and element.key == key or not (self.verify or self.overflow.size):
+			return element
+		element, _ = self.overflow._get_entry(key)
+		return element
+
+	def __contains__(self, key):
+		return self._get_entry(key) is not HashTable.NoValue
+
+	def search(self, key):
+		"""A search function to find a key
+		key: the key to be searched
+		"""
+		return self._get_entry(key).value
+
+	def __getitem__(self, key):
+		entry = self._get_entry(key)
+		if entry is HashTable.NoValue:
+			raise KeyError(key)
+		return entry.value
+
+	def __repr__(self):
+		tokens = []
+		for element in self.container + self.overflow.container:
+			if element is not HashTable.NoValue:
+				tokens.append("{0} : {1}".format(element.key, element.value))
+		return "{" + "\n".join(tokens) + "}"
+
+
+def benchmark_freeze(n=100000, lookups=5):
+	"""Compare build time, size and lookup speed of a frozen table
+	against the mutable HashTable it was built from
+	"""
+	keys = ["key{0}".format(i) for i in range(n)]
+	start = time.perf_counter()
+	ht = HashTable()
+	for i, key in enumerate(keys):
+		ht.set(key, i)
+	mutableBuild = time.perf_counter() - start
+	start = time.perf_counter()
+	frozen = ht.freeze()
+	frozenBuild = time.perf_counter() - start
+	mutableLookup = timeit.timeit(lambda: [ht.search(key) for key in keys], number=lookups)
+	frozenLookup = timeit.timeit(lambda: [frozen.search(key) for key in keys], number=lookups)
+	print("{0:>8} {1:>12} {2:>8} {3:>14}".format("table", "build (s)", "slots", "lookup (us)"))
+	print("{0:>8} {1:>12.3f} {2:>8} {3:>14.3f}".format(
+		"mutable", mutableBuild, ht.containerSize, mutableLookup / (n * lookups) * 1e6))
+	print("{0:>8} {1:>12.3f} {2:>8} {3:>14.3f}".format(
+		"frozen", frozenBuild, len(frozen.container), frozenLookup / (n * lookups) * 1e6))
+
+
+def benchmark_count(n=200000, vocabulary=5000, repeat=3):
+	"""Compare word-count throughput of search() + set() with add() and
+	count_many() on a synthetic token stream
+	"""
+	tokens = ["word{0}".format((i * 7919) % vocabulary) for i in range(n)]
+
+	def searchSet():
+		ht = HashTable()
+		for token in tokens:
+			count = ht.search(token)
+			ht.set(token, 1 if count is None else count + 1)
+
+	def add():
+		ht = HashTable()
+		for token in tokens:
+			ht.add(token)
+
+	def countMany():
+		HashTable().count_many(tokens)
+
+	print("{0:>12} {1:>16}".format("method", "tokens/s"))
+	for name, function in (("search+set", searchSet), ("add", add), ("count_many", countMany)):
+		elapsed = min(timeit.repeat(function, number=1, repeat=repeat))
+		print("{0:>12} {1:>16,.0f}".format(name, n / elapsed))
+
+
+def benchmark_join(n=100000, overlap=0.5, repeat=3):
+	"""Compare intersection and join against search() on every key and
+	against the same operations on dict
+	"""
+	left = HashTable()
+	right = HashTable()
+	leftDict = {}
+	rightDict = {}
+	shift = int(n * (1 - overlap))
+	for i in range(n):
+		left.set("key{0}".format(i), i)
+		right.set("key{0}".format(i + shift), i)
+		leftDict["key{0}".format(i)] = i
+		rightDict["key{0}".format(i + shift)] = i
+
+	def searchLoop():
+		return [key for key in leftDict if right.search(key) is not None]
+
+	cases = (
+		("search loop", searchLoop),
+		("intersection", lambda: left.intersection(right)),
+		("join", lambda: list(left.join(right))),
+		("dict keys &", lambda: leftDict.keys() & rightDict.keys()),
+		("dict join", lambda: [(k, v, rightDict[k]) for k, v in leftDict.items() if k in rightDict]),
+	)
+	print("{0:>14} {1:>12}".format("operation", "time (ms)"))
+	for name, function in cases:
+		elapsed = min(timeit.repeat(function, number=1, repeat=repeat))
+		print("{0:>14} {1:>12.1f}".format(name, elapsed * 1e3))
+
+
 class Hash_UnitTest(unittest.TestCase):
 	numbers = ('bloody', 'beautiful', 'bereft', 'blue', 'blues', 'Bolton', 'British', 'British-Railways')
 
@@ -160,6 +586,179 @@ class Hash_UnitTest(unittest.TestCase):
 			counter+=0
 		self.assertEqual(self.ht.delete('Moby Dick'), None)
 
+	def test_add_1(self):
+		""" Add to missing and existing keys """
+		self.assertEqual(self.ht.add('blue'), 1)
+		self.assertEqual(self.ht.add('blue', 4), 5)
+		self.assertEqual(self.ht.search('blue'), 5)
+		self.assertEqual(len(self.ht), 1)
+
+	def test_setdefault_1(self):
+		""" Setdefault only stores the default for a missing key """
+		self.assertEqual(self.ht.setdefault('blue', []), [])
+		self.ht.setdefault('blue', []).append(1)
+		self.assertEqual(self.ht.search('blue'), [1])
+
+	def test_get_or_compute_1(self):
+		""" The factory is only called for a missing key """
+		calls = []
+		factory = lambda key: calls.append(key) or len(key)
+		self.assertEqual(self.ht.get_or_compute('blues', factory), 5)
+		self.assertEqual(self.ht.get_or_compute('blues', factory), 5)
+		self.assertEqual(calls, ['blues'])
+
+	def test_pop_1(self):
+		""" Pop an existing and a missing key """
+		self.ht.set('blue', 1)
+		self.assertEqual(self.ht.pop('blue'), 1)
+		self.assertEqual(self.ht.pop('blue', 'gone'), 'gone')
+		self.assertEqual(len(self.ht), 0)
+
+	def test_pop_2(self):
+		""" Popping a key keeps later keys of its probe run reachable """
+		self.ht.set(8, 'a')
+		self.ht.set(16, 'b')
+		self.assertEqual(self.ht.pop(8), 'a')
+		self.assertEqual(self.ht.search(16), 'b')
+		self.assertEqual(self.ht.setdefault(16, 'c'), 'b')
+		self.assertEqual(len(self.ht), 1)
+
+	def test_delete_word_3(self):
+		""" Deleting keys keeps every remaining key reachable """
+		keys = list(range(0, 400, 8)) + list(self.numbers)
+		for counter, k in enumerate(keys):
+			self.ht.set(k, counter)
+		for k in keys[::2]:
+			self.ht.delete(k)
+		for counter, k in enumerate(keys):
+			self.assertEqual(self.ht.search(k), None if counter % 2 == 0 else counter)
+		self.assertEqual(len(self.ht), len(keys) // 2)
+
+	def test_count_many_1(self):
+		""" Count a token stream that forces resizes """
+		tokens = list(self.numbers) * 3 + ['blue']
+		self.ht.count_many(tokens)
+		self.assertEqual(len(self.ht), len(self.numbers))
+		self.assertEqual(self.ht.search('blue'), 4)
+		self.assertEqual(self.ht.search('Bolton'), 3)
+
+	def _fill(self, words):
+		ht = HashTable()
+		for counter, w in enumerate(words):
+			ht.set(w, counter)
+		return ht
+
+	def test_union_1(self):
+		""" Union keeps every key, with the values of the left table """
+		left = self._fill(self.numbers[:5])
+		right = self._fill(self.numbers[3:])
+		union = left.union(right)
+		self.assertEqual(len(union), len(self.numbers))
+		self.assertEqual(union.search('blue'), 3)
+		self.assertEqual(union.search('British-Railways'), 4)
+
+	def test_intersection_1(self):
+		""" Intersection from either side keeps the values of self """
+		left = self._fill(self.numbers[:5])
+		right = self._fill(self.numbers[3:])
+		for small, large in ((left, right), (right, left)):
+			common = small.intersection(large)
+			self.assertEqual(len(common), 2)
+			self.assertEqual(common.search('blue'), small.search('blue'))
+		self.assertEqual(len(left.intersection(HashTable())), 0)
+
+	def test_difference_1(self):
+		""" Difference keeps the keys missing from the other table """
+		left = self._fill(self.numbers[:5])
+		right = self._fill(self.numbers[3:])
+		difference = left.difference(right)
+		self.assertEqual(len(difference), 3)
+		self.assertEqual(difference.search('blue'), None)
+		self.assertEqual(difference.search('bloody'), 0)
+
+	def test_join_1(self):
+		""" Key join yields (key, value, other value) from either side """
+		left = self._fill(self.numbers[:5])
+		right = self._fill(self.numbers[3:])
+		expected = [('blue', 3, 0), ('blues', 4, 1)]
+		self.assertEqual(sorted(left.join(right)), expected)
+		self.assertEqual(sorted(right.join(left)), [(k, b, a) for k, a, b in expected])
+
+	def test_join_2(self):
+		""" Join on a function of the left entries """
+		left = self._fill(('blue', 'Bolton'))
+		right = HashTable()
+		right.set(4, 'four')
+		self.assertEqual(list(left.join(right, on=lambda key, value: len(key))), [('blue', 0, 'four')])
+
+	def test_freeze_1(self):
+		""" Frozen table has one slot per key and finds every key """
+		for counter, w in enumerate(self.numbers):
+			self.ht.set(w, counter)
+		frozen = self.ht.freeze()
+		self.assertEqual(len(frozen.container), len(self.numbers))
+		for counter, w in enumerate(self.numbers):
+			self.assertEqual(frozen.search(w), counter)
+
+	def test_freeze_2(self):
+		""" Frozen table rejects missing keys when verifying """
+		for counter, w in enumerate(self.numbers):
+			self.ht.set(w, counter)
+		frozen = self.ht.freeze()
+		self.assertEqual(frozen.search('Moby Dick'), None)
+		self.assertNotIn('Moby Dick', frozen)
+		self.assertRaises(KeyError, frozen.__getitem__, 'Moby Dick')
+
+	def test_freeze_3(self):
+		""" Unverified frozen table still finds every key """
+		for counter, w in enumerate(self.numbers):
+			self.ht.set(w, counter)
+		frozen = self.ht.freeze(verify=False)
+		for counter, w in enumerate(self.numbers):
+			self.assertEqual(frozen[w], counter)
+
+	def test_freeze_4(self):
+		""" Float keys whose hashes differ only in their high bits """
+		for keys in ((0.25, 0.75), tuple(i * 1.5 for i in range(8))):
+			ht = HashTable()
+			for counter, k in enumerate(keys):
+				ht.set(k, counter)
+			for verify in (True, False):
+				frozen = ht.freeze(verify)
+				for counter, k in enumerate(keys):
+					self.assertEqual(frozen[k], counter)
+
+	def test_freeze_5(self):
+		""" Distinct keys with the same hash go to the overflow table """
+		self.assertEqual(hash(-1), hash(-2))
+		self.ht.set(-1, 'minus one')
+		self.ht.set(-2, 'minus two')
+		self.ht.set(3, 'three')
+		for verify in (True, False):
+			frozen = self.ht.freeze(verify)
+			self.assertEqual(frozen.overflow.size, 1)
+			self.assertEqual(frozen[-1], 'minus one')
+			self.assertEqual(frozen[-2], 'minus two')
+			self.assertEqual(frozen[3], 'three')
+		self.assertNotIn(-3, frozen)
+
+	def test_freeze_6(self):
+		""" Every key survives freezing tables of many sizes """
+		for count in range(1, 80):
+			for keys in (['w{0}'.format(i) for i in range(count)], [-1, -2] + list(range(3, count + 3))):
+				ht = HashTable()
+				for counter, k in enumerate(keys):
+					ht.set(k, counter)
+				frozen = ht.freeze()
+				for counter, k in enumerate(keys):
+					self.assertEqual(frozen.search(k), counter)
+
+	def test_freeze_7(self):
+		""" Freezing an empty table """
+		frozen = self.ht.freeze()
+		self.assertEqual(len(frozen), 0)
+		self.assertEqual(frozen.search('blue'), None)
+
 
 
 def main():
@@ -2,9 +2,75 @@
 
 import unittest
 import math
+import random
+import secrets
 from enum import Enum
 
 
+class Node:
+    """ A node of a singly linked list, holding a key. """
+
+    def __init__(self, key):
+        self.key = key
+        self.next = None
+
+    def __str__(self):
+        return str(self.key)
+
+
+class LinkedList:
+    """ The chain stored in a slot of the table.
+
+    :ivar head: the first Node_ of the list (None if the list is empty)
+    :ivar length: the number of nodes in the list
+    """
+
+    def __init__(self):
+        self.head = None
+        self.length = 0
+
+    def set(self, node):
+        """ Make `node` the only element of the list. """
+        node.next = None
+        self.head = node
+        self.length = 1
+
+    def insert(self, node):
+        """ Insert `node` at the head of the list. """
+        node.next = self.head
+        self.head = node
+        self.length += 1
+
+    def search(self, key):
+        """ Return the first node that holds `key`, or None. """
+        node = self.head
+        while node is not None and node.key != key:
+            node = node.next
+        return node
+
+    def delete(self, node):
+        """ Unlink `node` from the list. """
+        if self.head is node:
+            self.head = node.next
+            self.length -= 1
+            return
+        previous = self.head
+        while previous is not None and previous.next is not node:
+            previous = previous.next
+        if previous is not None:
+            previous.next = node.next
+            self.length -= 1
+
+    def __iter__(self):
+        node = self.head
+        while node is not None:
+            yield node
+            node = node.next
+
+    def __str__(self):
+        return ' -> '.join(str(node) for node in self)
+
+
 class OpenAddressHashTable:
     """ A Hash Table implementation. This classroom exercise draws from CLRS3, 11.3. It is certainly not ready for the real world:
         * it accepts only strings as keys
@@ -43,22 +109,39 @@ class OpenAddressHashTable:
     :ivar size: Size of the table (initial value: :math:`89`): if the multiplication method is used, the size is :math:`2^p`.
     :ivar population: Number of elements in the table (initial value: 0)
     :ivar hash_method: A reference to the hashing method to used on numerical keys (initial value: HashTable.DIVISION)
+    :ivar key_method: A reference to the procedure that turns a string into a numerical key (initial value: string_to_int_)
+    :ivar max_chain: if set, a keyed table re-seeds and rehashes when a chain grows longer than `max_chain` times the load factor (rounded up)
+    :ivar reseeds: Number of times the table has been re-seeded (initial value: 0)
+
+    The DIVISION and MULTIPLICATION methods hash a fixed, public radix-31 expansion of the key: anyone who chooses the keys can make them all collide (f.i. 'Aa' and 'BB' have the same expansion). The keyed methods draw a random seed for every table:
+
+        * UNIVERSAL: the key is read as a polynomial evaluated at a random point modulo the prime :math:`p=2^{61}-1`, then hashed with :math:`h_{ab}(k) = ((ak+b) \\text{ mod } p) \\text{ mod } m` (CLRS3, 11.3.3)
+        * SIPHASH: the UTF-8 bytes of the key are hashed with SipHash-2-4 keyed with the 128-bit seed, then reduced with the division method
 
     """
 
     class HashingMethod(Enum):
         DIVISION = 0
         MULTIPLICATION = 1
+        UNIVERSAL = 2
+        SIPHASH = 3
+
+    _PRIME = 2 ** 61 - 1
+    _MASK64 = 2 ** 64 - 1
 
-    def __init__(self, method=HashingMethod.DIVISION, wordsize=64, p=7):
+    def __init__(self, method=HashingMethod.DIVISION, wordsize=64, p=7, seed=None, max_chain=None):
         """
         Create a new HashTable object.
 
-        :param method: the hashing method to be used. It can be either HashTable.HashingMethod.DIVISION (the default) or HashTable.HashingMethod.MULTIPLICATION.
+        :param method: the hashing method to be used: HashTable.HashingMethod.DIVISION (the default), MULTIPLICATION, UNIVERSAL or SIPHASH.
         :type method: HashTable.HashingMethod
         :param wordsize: the number of bits used to encode a numerical key (default: 64); useful for the multiplication method implementation
         :type wordsize: int
         :param p: if using the multiplication method, the number of bits allocated to the table size :math:`m=2^p`
+        :param seed: a 128-bit seed for the keyed methods (default: drawn at random)
+        :type seed: int
+        :param max_chain: re-seed a keyed table when a chain exceeds this multiple of the load factor (default: never)
+        :type max_chain: float
         """
         self.population = 0
 
@@ -74,6 +157,19 @@ class OpenAddressHashTable:
             self.size = 2 ** (self._P)
             self.hash_method = self.hash_multiply
 
+        self.method = method
+        self.key_method = self.string_to_int
+        if method == self.HashingMethod.UNIVERSAL:
+            self.key_method = self.string_to_int_keyed
+            self.hash_method = self.hash_universal
+        elif method == self.HashingMethod.SIPHASH:
+            self.key_method = self.siphash
+
+        self.max_chain = max_chain
+        self._reseed_population = 0
+        self.reseeds = 0
+        self.seed(seed)
+
         self.array = [None] * self.size
 
     def insert(self, key):
@@ -105,6 +201,55 @@ class OpenAddressHashTable:
             list = location
             list.insert(Node(key))
             self.population += 1
+        if self._chain_too_long(list):
+            self.reseed()
+
+    def seed(self, seed=None):
+        """
+        Set the key of the keyed hashing methods. It does not move existing keys: use reseed_ on a populated table.
+
+        :param seed: a 128-bit integer (default: drawn from the operating system's random source)
+        :type seed: int
+        """
+        if seed is None:
+            seed = secrets.randbits(128)
+        self._seed = seed
+        self._k0 = seed & self._MASK64
+        self._k1 = (seed >> 64) & self._MASK64
+        rng = random.Random(seed)
+        self._a = rng.randrange(1, self._PRIME)
+        self._b = rng.randrange(0, self._PRIME)
+        self._radix = rng.randrange(2 ** 32, self._PRIME)
+
+    def reseed(self, seed=None):
+        """
+        .. _reseed:
+
+        Draw a new seed and rehash every key in the table.
+
+        :param seed: a 128-bit integer (default: drawn at random)
+        :type seed: int
+        """
+        keys = [node.key for list in self.array if list is not None for node in list]
+        self.seed(seed)
+        self.array = [None] * self.size
+        self.population = 0
+        max_chain, self.max_chain = self.max_chain, None
+        for key in keys:
+            self.insert(key)
+        self.max_chain = max_chain
+        self._reseed_population = self.population
+        self.reseeds += 1
+
+    def _chain_too_long(self, list):
+        """
+        Whether inserting into `list` should trigger a re-seed. Only keyed tables re-seed, and at most once per doubling of the population, so that repeated keys (which no seed can separate) cost amortized constant time.
+        """
+        if self.max_chain is None or self.method not in (self.HashingMethod.UNIVERSAL, self.HashingMethod.SIPHASH):
+            return False
+        if self.population < 2 * self._reseed_population:
+            return False
+        return list.length > self.max_chain * math.ceil(self.population / self.size)
 
     def search(self, key):
         """
@@ -126,6 +271,8 @@ class OpenAddressHashTable:
         """
         hash_value = self.hash(key)
         list = self.array[hash_value]
+        if list is None:
+            return None
         value = list.search(key)
         if value == None:
             return value
@@ -178,9 +325,88 @@ class OpenAddressHashTable:
         :return: an index in the array.
         :rtype: int
         """
-        value = self.string_to_int(key)
+        value = self.key_method(key)
         return self.hash_method(value)
 
+    def hash_universal(self, numkey):
+        """
+        .. _hash_universal:
+
+        Hash a numerical key with a function drawn from the universal family of CLRS3, 11.3.3, where :math:`a` and :math:`b` come from the table's seed:
+
+        .. math::
+            h_{ab}(k) = ((ak+b) \\text{ mod } p) \\text{ mod } m
+
+        :param numkey: a numerical key, smaller than :math:`p`
+        :type numkey: int
+        :return: an index in the array
+        :rtype: int
+        """
+        return ((self._a * numkey + self._b) % self._PRIME) % self.size
+
+    def string_to_int_keyed(self, s):
+        """
+        .. _string_to_int_keyed:
+
+        Interpret a string as a number smaller than :math:`p`, like string_to_int_ but with a secret radix :math:`x` drawn from the seed, and reducing modulo :math:`p` at each step (Horner's rule). Each character contributes `ord(c) + 1`, so that no coefficient is zero: otherwise leading NUL characters would add nothing, and 'a', '\\x00a', '\\x00\\x00a'... would collide for every seed. Two distinct strings of length at most :math:`n` then agree with probability at most :math:`n/p`.
+
+        :param s: a string object
+        :type s: str
+        :return: an integer in :math:`[0, p)`
+        :rtype: int
+        """
+        string_as_number = 0
+        for c in s:
+            string_as_number = (string_as_number * self._radix + ord(c) + 1) % self._PRIME
+        return string_as_number
+
+    def siphash(self, s):
+        """
+        .. _siphash:
+
+        Hash the UTF-8 bytes of a string with SipHash-2-4, keyed with the table's 128-bit seed.
+
+        :param s: a string object
+        :type s: str
+        :return: a 64-bit integer
+        :rtype: int
+        """
+        mask = self._MASK64
+
+        def rotl(x, b):
+            return ((x << b) | (x >> (64 - b))) & mask
+
+        def sipround(v0, v1, v2, v3):
+            v0 = (v0 + v1) & mask
+            v1 = rotl(v1, 13) ^ v0
+            v0 = rotl(v0, 32)
+            v2 = (v2 + v3) & mask
+            v3 = rotl(v3, 16) ^ v2
+            v0 = (v0 + v3) & mask
+            v3 = rotl(v3, 21) ^ v0
+            v2 = (v2 + v1) & mask
+            v1 = rotl(v1, 17) ^ v2
+            v2 = rotl(v2, 32)
+            return v0, v1, v2, v3
+
+        data = s.encode('utf-8') if isinstance(s, str) else bytes(s)
+        v0 = self._k0 ^ 0x736f6d6570736575
+        v1 = self._k1 ^ 0x646f72616e646f6d
+        v2 = self._k0 ^ 0x6c7967656e657261
+        v3 = self._k1 ^ 0x7465646279746573
+        tail = len(data) % 8
+        words = [int.from_bytes(data[i:i + 8], 'little') for i in range(0, len(data) - tail, 8)]
+        words.append(int.from_bytes(data[len(data) - tail:], 'little') | ((len(data) & 0xff) << 56))
+        for m in words:
+            v3 ^= m
+            v0, v1, v2, v3 = sipround(v0, v1, v2, v3)
+            v0, v1, v2, v3 = sipround(v0, v1, v2, v3)
+            v0 ^= m
+        v2 ^= 0xff
+        for _ in range(4):
+            v0, v1, v2, v3 = sipround(v0, v1, v2, v3)
+        return v0 ^ v1 ^ v2 ^ v3
+
     def hash_multiply(self, numkey):
         """
         .. _hash_multiply:
@@ -320,6 +546,115 @@ class OpenAddressHashTable:
         return output
 
 
+def benchmark_adversarial(bits=11, flooded=300, max_chain=1.5, leaked_seed=0):
+    """
+    Print the longest chain, the mean number of nodes visited by a successful search and the number of re-seeds for two attacks:
+
+    * 'Aa/BB': :math:`2^{bits}` keys built from the blocks 'Aa' and 'BB', which share the same radix-31 expansion and therefore collide under the DIVISION and MULTIPLICATION methods whatever the table size. Keyed tables draw a fresh seed and spread them.
+    * 'flooded': `flooded` keys brute-forced to share one slot under a known (leaked) seed, inserted into keyed tables using that seed, without and with a `max_chain` threshold. Re-seeding draws a secret seed and breaks the chain.
+
+    Re-seeding cannot shorten the chains of an honestly seeded table: the table size is static, so chains grow with the load whatever the seed, and the threshold is relative to that load.
+
+    :param bits: number of two-character blocks in each 'Aa/BB' key
+    :type bits: int
+    :param flooded: number of keys forced into one slot under the leaked seed
+    :type flooded: int
+    :param max_chain: the re-seed threshold of the second 'flooded' run
+    :type max_chain: float
+    :param leaked_seed: the seed known to the attacker
+    :type leaked_seed: int
+    """
+    keys = ['']
+    for _ in range(bits):
+        keys = [k + block for k in keys for block in ('Aa', 'BB')]
+    keyed = (OpenAddressHashTable.HashingMethod.UNIVERSAL, OpenAddressHashTable.HashingMethod.SIPHASH)
+    runs = [(method, 'Aa/BB', keys, None, None) for method in OpenAddressHashTable.HashingMethod]
+    for method in keyed:
+        leaked = OpenAddressHashTable(method, seed=leaked_seed)
+        target = leaked.hash('k0')
+        forced = []
+        i = 0
+        while len(forced) < flooded:
+            key = 'k{}'.format(i)
+            if leaked.hash(key) == target:
+                forced.append(key)
+            i += 1
+        runs += [(method, 'flooded', forced, leaked_seed, None), (method, 'flooded', forced, leaked_seed, max_chain)]
+    print('{:>16} {:>8} {:>10} {:>10} {:>12} {:>8}'.format('method', 'keys', 'max_chain', 'max chain', 'mean probes', 'reseeds'))
+    for method, name, run_keys, seed, threshold in runs:
+        ht = OpenAddressHashTable(method, seed=seed, max_chain=threshold)
+        for key in run_keys:
+            ht.insert(key)
+        chains = [list.length for list in ht.array if list is not None]
+        # a successful search for the i-th node of a chain visits i nodes
+        probes = sum(length * (length + 1) // 2 for length in chains) / len(run_keys)
+        print('{:>16} {:>8} {:>10} {:>10} {:>12.1f} {:>8}'.format(
+            method.name, name, str(threshold), max(chains), probes, ht.reseeds))
+
+
+class KeyedHash_UnitTest(unittest.TestCase):
+    colliding = ('AaAa', 'AaBB', 'BBAa', 'BBBB')
+
+    def test_colliding_keys_division(self):
+        """ Keys with the same radix-31 expansion share a slot under the division method """
+        ht = OpenAddressHashTable()
+        self.assertEqual(len({ht.hash(k) for k in self.colliding}), 1)
+
+    def test_universal_insert_search(self):
+        """ Insert, search and delete with universal hashing """
+        ht = OpenAddressHashTable(OpenAddressHashTable.HashingMethod.UNIVERSAL, seed=1)
+        for k in self.colliding:
+            ht.insert(k)
+        self.assertEqual(ht.search('BBAa'), 'BBAa')
+        self.assertEqual(ht.search('Moby Dick'), None)
+        ht.delete('BBAa')
+        self.assertEqual(ht.search('BBAa'), None)
+        self.assertEqual(ht.population, 3)
+
+    def test_universal_leading_nul(self):
+        """ Keys that differ only by leading NUL characters spread across slots """
+        keys = ['\x00' * i + 'a' for i in range(500)]
+        for seed in range(5):
+            ht = OpenAddressHashTable(OpenAddressHashTable.HashingMethod.UNIVERSAL, seed=seed)
+            self.assertEqual(len({ht.string_to_int_keyed(k) for k in keys}), len(keys))
+            for k in keys:
+                ht.insert(k)
+            self.assertLess(max(list.length for list in ht.array if list is not None), 30)
+
+    def test_universal_seed(self):
+        """ The same seed gives the same hash, and the keyed value stays below p """
+        ht1 = OpenAddressHashTable(OpenAddressHashTable.HashingMethod.UNIVERSAL, seed=42)
+        ht2 = OpenAddressHashTable(OpenAddressHashTable.HashingMethod.UNIVERSAL, seed=42)
+        self.assertEqual(ht1.hash('plumage'), ht2.hash('plumage'))
+        self.assertLess(ht1.string_to_int_keyed('x' * 100), OpenAddressHashTable._PRIME)
+
+    def test_siphash_vectors(self):
+        """ SipHash-2-4 reference vectors (key 00..0f) """
+        ht = OpenAddressHashTable(OpenAddressHashTable.HashingMethod.SIPHASH,
+                                  seed=int.from_bytes(bytes(range(16)), 'little'))
+        self.assertEqual(ht.siphash(b''), 0x726fdb47dd0e0e31)
+        self.assertEqual(ht.siphash(bytes(range(15))), 0xa129ca6149be45e5)
+
+    def test_reseed_keeps_keys(self):
+        """ Re-seeding rehashes every key """
+        ht = OpenAddressHashTable(OpenAddressHashTable.HashingMethod.SIPHASH, seed=7)
+        for k in self.colliding:
+            ht.insert(k)
+        ht.reseed(8)
+        self.assertEqual(ht.population, 4)
+        for k in self.colliding:
+            self.assertEqual(ht.search(k), k)
+
+    def test_max_chain_reseeds(self):
+        """ A chain longer than the threshold triggers a re-seed """
+        ht = OpenAddressHashTable(OpenAddressHashTable.HashingMethod.UNIVERSAL, seed=3, max_chain=1)
+        ht.insert('blue')
+        ht.insert('blue')
+        self.assertNotEqual(ht._seed, 3)
+        self.assertEqual(ht.reseeds, 1)
+        self.assertEqual(ht.population, 2)
+
+
 ########################### DO NOT MODIFY BELOW THIS LINE ##############################################
 
 class Hash_UnitTest(unittest.TestCase):